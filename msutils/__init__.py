@@ -1,7 +1,7 @@
 from .page import Page
 from .edition import (
-    edition_dir, NoEditionError, NoEditionStoresError,
+    Edition, edition_dir, NoEditionError, NoEditionStoresError,
     edition_indd_files, edition_press_pdfs, edition_web_pdfs,
     directory_indd_files, directory_pdfs)
 from .uploading import (
-    send_pages_ftp, send_pages_sftp)
+    send_pages_ftp, send_pages_sftp, send_pages_sftp_bundled)
@@ -1,5 +1,7 @@
 import logging
+import os
 from pathlib import Path
+import time
 
 from .page import Page
 
@@ -20,6 +22,16 @@ EDITION_STORES = [
     (Path('/Volumes/Archive since 2017'), ARCHIVE_EDITION_TEMPLATE),
     ]
 
+# How long the list of connected stores is reused before checking again
+STORES_CACHE_SECONDS = 5
+
+# (time.monotonic() of last scan or None, connected stores)
+_stores_cache = (None, [])
+
+# Edition directories found in the connected stores, by date.
+# Emptied whenever the stores are checked again.
+_edition_dirs = {}
+
 
 class NoEditionError(Exception):
     """No edition can be found for the given date"""
@@ -31,6 +43,13 @@ class NoEditionStoresError(Exception):
     pass
 
 
+def _clear_stores_cache():
+    """Forget the connected stores so the next lookup checks them again"""
+    global _stores_cache
+    _stores_cache = (None, [])
+    _edition_dirs.clear()
+
+
 def _fetch_stores():
     """Return paths to edition stores along with path templates
 
@@ -39,7 +58,17 @@ def _fetch_stores():
 
     Template is returned because of differences in where editions are
     stored when considered 'current' and when moved to the archive.
+
+    The stores are network mounts, so the result is reused for
+    STORES_CACHE_SECONDS rather than checking each one on every call.
     """
+    global _stores_cache
+    scanned_at, present_stores = _stores_cache
+    if (scanned_at is not None and
+            time.monotonic() - scanned_at < STORES_CACHE_SECONDS):
+        return present_stores
+
+    _edition_dirs.clear()
     present_stores = [(path, ed_template)
                       for (path, ed_template) in EDITION_STORES
                       if path.exists()]
@@ -48,6 +77,7 @@ def _fetch_stores():
         '\n    '.join(str(p) for p, t in present_stores))
 
     if present_stores:
+        _stores_cache = (time.monotonic(), present_stores)
         return present_stores
     else:
         raise NoEditionStoresError(
@@ -59,12 +89,20 @@ def edition_dir(date):
 
     Raises NoEditionError if an edition can't be
     found in the expected locations for date.
+
+    A directory that is found is remembered for as long as the list of
+    connected stores is (see STORES_CACHE_SECONDS). Missing editions
+    are checked for again on each call, as they may yet be created.
     """
     present_stores = _fetch_stores()
+    if date in _edition_dirs:
+        return _edition_dirs[date]
+
     for store, path_template in present_stores:
         candidate = store.joinpath(path_template.format(date))
         if candidate.exists():
             logger.debug('Found edition dir: %s', candidate)
+            _edition_dirs[date] = candidate
             return candidate
         else:
             logger.debug('Did not find edition: %s', candidate)
@@ -72,16 +110,24 @@ def edition_dir(date):
         raise NoEditionError(f'Cannot find edition for {date:%Y-%m-%d}')
 
 
-def _paths_to_pages(paths):
-    """Yield Pages from Paths, handling exceptions from non-Pages"""
-    for p in paths:
+def _names_to_pages(names):
+    """Yield Pages from (directory, name) pairs, handling non-Pages"""
+    for parent, name in names:
         try:
-            yield Page(p)
+            yield Page.from_name(name, parent)
         except ValueError as e:
             logger.warning('Could not parse file as Page: %s', e)
             continue
 
 
+def _walk_indd_names(path):
+    """Yield (directory, name) of .indd files in path and its subdirectories"""
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            if name.endswith('.indd'):
+                yield dirpath, name
+
+
 def directory_indd_files(path):
     """List all the InDesign files in the given directory
 
@@ -91,7 +137,8 @@ def directory_indd_files(path):
     inserts are often kept in subdirectories instead of in the root
     of the edition directory.
     """
-    return sorted(_paths_to_pages(path.rglob('*.indd')))
+    return sorted(_names_to_pages(_walk_indd_names(path)),
+                  key=Page._comparison_keys)
 
 
 def _filter_pages_for_date(pages, date):
@@ -103,18 +150,24 @@ def _filter_pages_for_date(pages, date):
     missing pages 'expectedly' if the date difference
     is subtle or not otherwise notice.
     """
-    dates_present = {page.date for page in pages}
-    if len(dates_present) == 1:
-        # Everything's fine, so return
+    if all(page.date == pages[0].date for page in pages):
+        # Everything's fine (or there are no pages), so return
         return pages
 
-    unexpected_pages = {p for p in pages if p.date != date}
+    expected_pages = []
+    unexpected_pages = []
+    for page in pages:
+        if page.date == date:
+            expected_pages.append(page)
+        else:
+            unexpected_pages.append(page)
+
     logger.warning(
         "Found pages with dates different to expected (%s): %s",
         date,
-        sorted(unexpected_pages)
+        sorted(unexpected_pages, key=Page._comparison_keys)
     )
-    expected_pages = sorted(set(pages) - unexpected_pages)
+    expected_pages.sort(key=Page._comparison_keys)
     logger.warning(
         "Only returning pages that match given date: %s",
         expected_pages
@@ -122,38 +175,69 @@ def _filter_pages_for_date(pages, date):
     return expected_pages
 
 
-def edition_indd_files(date):
-    """List InDesign Pages for date's edition"""
-    all_files = directory_indd_files(edition_dir(date))
-    return _filter_pages_for_date(all_files, date)
-
-
 def directory_pdfs(path):
     """List Page-acceptable PDFs in path"""
     # PDFs directory may not exist yet, even if the edition does
-    if not path.exists():
+    try:
+        with os.scandir(path) as entries:
+            all_pdfs = [(path, e.name) for e in entries
+                        if e.name.endswith('.pdf')]
+    except FileNotFoundError:
         return []
-    all_pdfs = [p for p in path.iterdir() if p.suffix == '.pdf']
-    return sorted(_paths_to_pages(all_pdfs))
+    return sorted(_names_to_pages(all_pdfs), key=Page._comparison_keys)
+
+
+class Edition:
+    """An edition's directory, found once and used to list its files
+
+    The edition_* functions each look up the edition directory for
+    their date, which means checking the edition stores again once
+    the remembered result has expired. When more than one kind of file
+    is needed for the same edition, create an Edition and call its
+    methods instead.
+
+    Raises NoEditionError if an edition can't be found for date.
+    """
+
+    def __init__(self, date):
+        self.date = date
+        self.dir = edition_dir(date)
+
+    def __repr__(self):
+        """Return string Edition(date)"""
+        return '{0}({1})'.format(self.__class__.__name__,
+                                 repr(self.date))
+
+    def _subdirectory_pdfs(self, subdir_template):
+        """List PDFs in the subdirectory specified in the template"""
+        pdfs_dir = self.dir.joinpath(subdir_template.format(self.date))
+        all_pdfs = directory_pdfs(pdfs_dir)
+        return _filter_pages_for_date(all_pdfs, self.date)
 
+    def indd_files(self):
+        """List InDesign Pages for the edition"""
+        all_files = directory_indd_files(self.dir)
+        return _filter_pages_for_date(all_files, self.date)
 
-def _edition_subdirectory(date, subdir_template):
-    """Return path to subdirectory of edition specified in the template"""
-    ed_dir = edition_dir(date)
-    return ed_dir.joinpath(subdir_template.format(date))
+    def press_pdfs(self):
+        """List pre-press PDFs for the edition"""
+        return self._subdirectory_pdfs(PRESS_PDFS_TEMPLATE)
 
+    def web_pdfs(self):
+        """List low-quality PDFs for the edition"""
+        return self._subdirectory_pdfs(WEB_PDFS_TEMPLATE)
 
-def _fetch_pdfs_for_directory_template(date, template):
-    pdfs_dir = _edition_subdirectory(date, template)
-    all_pdfs = directory_pdfs(pdfs_dir)
-    return _filter_pages_for_date(all_pdfs, date)
+
+def edition_indd_files(date):
+    """List InDesign Pages for date's edition"""
+    return Edition(date).indd_files()
 
 
 def edition_press_pdfs(date):
     """List pre-press PDFs for date's edition"""
-    return _fetch_pdfs_for_directory_template(date, PRESS_PDFS_TEMPLATE)
+    return Edition(date).press_pdfs()
 
 
 def edition_web_pdfs(date):
     """List low-quality PDFs for date's edition"""
-    return _fetch_pdfs_for_directory_template(date, WEB_PDFS_TEMPLATE)
+    return Edition(date).web_pdfs()
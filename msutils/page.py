@@ -1,29 +1,118 @@
-from datetime import datetime
+from datetime import date
+import functools
 from pathlib import Path
-import re
+import sys
 
 
-class Page(object):
+_SEPARATORS = '-_ '
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date(date_str):
+    """Return a date from a filename's date, possibly hyphenated
+
+    The date is always day, month and year as digits (already checked
+    by _parse_page_name) so it is sliced directly rather than
+    going through strptime. Two-digit years follow strptime's %y rule:
+    69-99 are 1969-1999 and 00-68 are 2000-2068.
+
+    An edition has hundreds of files but only a handful of dates,
+    so results are cached.
+    """
+    date_str = date_str.replace('-', '')
+    year = int(date_str[4:])
+    if len(date_str) == 6:
+        year += 1900 if year >= 69 else 2000
+    return date(year, int(date_str[2:4]), int(date_str[:2]))
+
+
+def _invalid_name(name):
+    """Return the ValueError raised for a name that isn't a page's"""
+    return ValueError(f'{name} is an invalid filename')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_page_name(name):
+    """Return (pages, date, prefix, section, type) parsed from name
+
+    Raises ValueError if name does not follow the Morning Star
+    convention, such as 1_Front_040516.indd, made up of:
+        prefix          optional single letter
+        first page      digits
+        second page     optional, hyphen then digits, if a spread
+        section         non-digits, between any separators (-_ )
+        date            ddmmyy, ddmmyyyy, dd-mm-yy or dd-mm-yyyy
+        type            .indd or .pdf, case-insensitively
+
+    The name is scanned directly rather than with a regular expression,
+    as the section's surrounding separators made the equivalent pattern
+    backtrack heavily on long malformed names.
+
+    Only the file name is considered, so results are cached and shared
+    between Pages with the same name, such as an edition's press and
+    web PDFs or repeated scans of the same directory. The section and
+    type are interned as an edition repeats a few of each many times.
+    """
+    stem, dot, file_type = name.rpartition('.')
+    file_type = file_type.lower()
+    if not dot or file_type not in ('indd', 'pdf'):
+        raise _invalid_name(name)
+
+    # Date is the run of digits at the end of the stem, or the last
+    # three hyphenated groups if that run is two or four digits long
+    date_start = len(stem)
+    while date_start and stem[date_start - 1].isdecimal():
+        date_start -= 1
+    date_length = len(stem) - date_start
+    if date_length in (2, 4):
+        date_start -= 6
+        if (date_start < 0 or
+                stem[date_start + 2] != '-' or
+                stem[date_start + 5] != '-' or
+                not stem[date_start:date_start + 2].isdecimal() or
+                not stem[date_start + 3:date_start + 5].isdecimal()):
+            raise _invalid_name(name)
+    elif date_length not in (6, 8):
+        raise _invalid_name(name)
+
+    prefix = ''
+    pos = 0
+    if stem[:1].isascii() and stem[:1].isalpha():
+        prefix = stem[0]
+        pos = 1
+
+    end = pos
+    while end < date_start and stem[end].isdecimal():
+        end += 1
+    if end == pos:
+        raise _invalid_name(name)
+    pages = [stem[pos:end]]
+    if (stem[end:end + 1] == '-' and end + 1 < date_start and
+            stem[end + 1].isdecimal()):
+        pos = end = end + 1
+        while end < date_start and stem[end].isdecimal():
+            end += 1
+        pages.append(stem[pos:end])
+
+    # If only separators remain, the last one is taken as the section
+    rest = stem[end:date_start]
+    section = rest.strip(_SEPARATORS) or rest[-1:]
+    if not section or any(c.isdecimal() for c in rest):
+        raise _invalid_name(name)
+
+    return (tuple(map(int, pages)), _parse_date(stem[date_start:]),
+            prefix, sys.intern(section), sys.intern(file_type))
+
+
+@functools.total_ordering
+class Page:
     """Represents a page file on disk.
 
     Can be used for both InDesign (.indd) and PDF files.
     """
 
-    _page_name_regex = re.compile(r'''
-    ^
-    (?P<prefix> [A-Z]{0,1} )
-    (?P<first_page>  \d+)
-    (?: -
-        (?P<second_page> \d+)
-    )?
-    [-_ ]*
-    (?P<section> \D+? )
-    [-_ ]*
-    (?P<date> \d{6} | \d{8} | \d{2}-\d{2}-(?:\d{2}|\d{4}) )
-    \.
-    (?P<type> indd | pdf )
-    $
-    ''', flags=re.VERBOSE | re.IGNORECASE)
+    __slots__ = ('path', 'pages', 'date', 'prefix', 'section', 'type',
+                 '_key', '_hash', '_external_name')
 
     def __init__(self, page_path: Path):
         """Set up Page from a path to a file on disk
@@ -31,36 +120,41 @@ class Page(object):
         page_path:  pathlib.Path object
 
         The page stored at page_path should be named according to the
-        usual Morning Star convention, described in this class's
-        page_name_regex pattern.
+        usual Morning Star convention, described in _parse_page_name.
         """
-        regex_match = self._page_name_regex.match(page_path.name)
-        if not regex_match:
-            raise ValueError(f'{page_path.name} is an invalid filename')
+        self._set_up(page_path, _parse_page_name(page_path.name))
 
+    def _set_up(self, page_path, fields):
+        """Set attributes from page_path and its name's parsed fields"""
+        (self.pages, self.date, self.prefix,
+         self.section, self.type) = fields
         self.path = page_path.expanduser()
-
-        pages = [regex_match['first_page']]
-        if regex_match['second_page'] is not None:
-            pages.append(regex_match['second_page'])
-        self.pages = tuple(map(int, pages))
-
-        date_match = regex_match['date'].replace('-', '')
-        if len(date_match) == 6:
-            date_format = '%d%m%y'
-        elif len(date_match) == 8:
-            date_format = '%d%m%Y'
-
-        self.date = datetime.strptime(date_match, date_format).date()
-
-        self.prefix = regex_match['prefix']
-        self.section = regex_match['section']
-        self.type = regex_match['type'].lower()
+        self._key = (self.date, self.type, self.prefix,
+                     self.pages, sys.intern(self.section.lower()))
+        self._hash = hash(self._key)
+        self._external_name = None
+
+    @classmethod
+    def from_name(cls, name, parent):
+        """Create a Page from a file name and the directory holding it
+
+        name:       str, the file's name
+        parent:     str or pathlib.Path, the file's directory
+
+        The name is parsed before a Path is built, so listing a
+        directory doesn't create Paths for files that aren't pages,
+        and the parsed fields are used directly rather than parsing
+        the name again. Like Page, raises ValueError if the name is
+        invalid.
+        """
+        fields = _parse_page_name(name)
+        page = cls.__new__(cls)
+        page._set_up(Path(parent, name), fields)
+        return page
 
     def __hash__(self):
-        return hash(
-            (self.path, self.pages, self.date, self.prefix, self.section, self.type)
-        )
+        """Hash the attributes used for equality, so equal Pages match"""
+        return self._hash
 
     def __str__(self):
         """Return the name of the underlying file"""
@@ -73,9 +167,12 @@ class Page(object):
 
     @staticmethod
     def _comparison_keys(page):
-        """Return list of important attributes for comparisons"""
-        return (page.date, page.type, page.prefix,
-                page.pages, page.section.lower())
+        """Return tuple of important attributes for comparisons
+
+        The tuple is built once when the Page is created, so this
+        is also suitable as a sort key: sorted(pages, key=...)
+        """
+        return page._key
 
     def __eq__(self, other):
         """Test for equality against another Page
@@ -86,23 +183,18 @@ class Page(object):
             * prefix
             * pages[0] (right-hand page number is ignored)
             * section (case-insensitively)
-        """
-        return self._comparison_keys(self) == self._comparison_keys(other)
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+        The remaining comparisons are derived from this and __lt__
+        by functools.total_ordering.
+        """
+        if not isinstance(other, Page):
+            return NotImplemented
+        return self._key == other._key
 
     def __lt__(self, other):
-        return self._comparison_keys(self) < self._comparison_keys(other)
-
-    def __gt__(self, other):
-        return self._comparison_keys(self) > self._comparison_keys(other)
-
-    def __le__(self, other):
-        return (self.__lt__(other) or self.__eq__(other))
-
-    def __ge__(self, other):
-        return (self.__gt__(other) or self.__eq__(other))
+        if not isinstance(other, Page):
+            return NotImplemented
+        return self._key < other._key
 
     def external_name(self):
         """Returns string used outside the Star to identify the page
@@ -120,14 +212,18 @@ class Page(object):
 
         For multiple pages with a prefix:
             MS_A_1929_12_31_002-003.indd
+
+        The name is built on the first call and reused after that,
+        as the attributes it is made from don't change.
         """
-        if not self.prefix:
-            template = 'MS_{date:%Y_%m_%d}_{nums}.{suffix}'
-        else:
-            template = 'MS_{prefix}_{date:%Y_%m_%d}_{nums}.{suffix}'
+        if self._external_name is not None:
+            return self._external_name
 
-        num_str = '-'.join(f'{p:03}' for p in self.pages)
+        prefix = f'{self.prefix}_' if self.prefix else ''
+        d = self.date
+        num_str = '-'.join([f'{p:03}' for p in self.pages])
 
-        return template.format(
-            date=self.date, prefix=self.prefix, suffix=self.type,
-            nums=num_str)
+        # Date fields are formatted directly, rather than with strftime
+        self._external_name = (f'MS_{prefix}{d.year}_{d.month:02}_{d.day:02}_'
+                               f'{num_str}.{self.type}')
+        return self._external_name
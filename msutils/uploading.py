@@ -1,5 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 import ftplib
 import logging
+import queue
+import shlex
+import socket
+import tarfile
+import time
 
 import paramiko
 
@@ -7,65 +14,205 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-def send_pages_ftp(pages, host, user, password='',
-                   path=None, rename=True):
-    """Upload a set of Pages to an FTP server
+def _retry(fn, tries, delay, backoff, exceptions):
+    """Call fn until it returns, retrying if it raises exceptions
 
-    pages: [Page],
-    host: str,
-    user: str,
-    passwd: str = '',
-    path: str = None,
-    rename: bool = True
+    fn is called at most tries times. After the first failure there is
+    a wait of delay seconds, multiplied by backoff after each further
+    failure. If the last attempt fails its exception is raised.
+    """
+    for attempt in range(1, tries + 1):
+        try:
+            return fn()
+        except exceptions as e:
+            if attempt >= tries:
+                raise
+            logger.warning('Attempt %d of %d failed, retrying in %gs: %s',
+                           attempt, tries, delay, e)
+            time.sleep(delay)
+            delay *= backoff
 
-    Mostly a convenience wrapper around ftplib.FTP.
 
-    If given, path refers to the subdirectory or chain of
-    subdirectories into which the FTP client will change
-    before attempting to upload any files.
+def _check_tries(tries):
+    """Raise ValueError unless tries allows at least one attempt
 
-    If rename is True (the default), each page will be renamed
-    by calling its external_name method. If rename is False the
-    page's current filename will be used.
+    With no attempts _retry would return without calling anything,
+    and the page would be logged as uploaded without being sent.
+    """
+    if tries < 1:
+        raise ValueError(f'tries must be at least 1, not {tries}')
+
+
+def _remote_names(pages, rename):
+    """Return list of (page, remote name) tuples to upload
+
+    If rename is True each page's external_name is used, otherwise its
+    current filename.
+
+    Where several pages have the same remote name only the last is
+    kept, as it would overwrite the others on the server anyway. The
+    list is sorted by remote name so uploads happen in a fixed order.
+    """
+    uploads = {}
+    for page in pages:
+        if rename:
+            new_name = page.external_name()
+        else:
+            new_name = page.path.name
+        if new_name in uploads:
+            logger.warning('Not uploading %s, as %s is also named %s',
+                           uploads[new_name], page, new_name)
+        uploads[new_name] = page
+    return [(uploads[name], name) for name in sorted(uploads)]
+
+
+def _upload_queue(uploads):
+    """Return a queue holding the (page, name) pairs in uploads"""
+    pending = queue.Queue()
+    for upload in uploads:
+        pending.put(upload)
+    return pending
+
+
+def _take_all(pending):
+    """Yield items from the queue pending until it is empty
+
+    Several workers can take from the same queue, so each item goes to
+    whichever worker is free, and a worker that never starts (such as
+    one that can't log in) leaves its share to the others.
+    """
+    while True:
+        try:
+            yield pending.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _ftp_is_current(server, page, new_name):
+    """Return True if new_name on the FTP server matches page
+
+    It matches if it is the same size as the page and was modified no
+    earlier. Any error (such as the file not existing) means no match,
+    and if the local file is missing the upload reports it.
+    """
+    try:
+        local = page.path.stat()
+    except OSError:
+        return False
+    try:
+        remote_size = server.size(new_name)
+        modified = server.sendcmd(f'MDTM {new_name}')
+        remote_mtime = datetime.strptime(
+            modified[4:18], '%Y%m%d%H%M%S').replace(tzinfo=timezone.utc)
+    except (ftplib.error_reply, ftplib.error_temp, ftplib.error_perm,
+            ValueError):
+        return False
+    return (remote_size == local.st_size and
+            remote_mtime.timestamp() >= int(local.st_mtime))
+
+
+def _sftp_is_current(server, page, new_name):
+    """Return True if new_name on the SFTP server matches page
+
+    It matches if it is the same size as the page and was modified no
+    earlier. Any error (such as the file not existing) means no match,
+    and if the local file is missing the upload reports it.
+    """
+    try:
+        local = page.path.stat()
+        remote = server.stat(new_name)
+    except OSError:
+        return False
+    return (remote.st_size == local.st_size and
+            remote.st_mtime >= int(local.st_mtime))
+
+
+def _stor_page(server, page_file, new_name):
+    """Upload an open page file to the connected FTP server as new_name
+
+    This is FTP.storbinary without its TYPE I command, which
+    send_pages_ftp sends once for the whole batch. The page is sent
+    with socket.sendfile, so the kernel copies it to the connection
+    where the system supports it, without reading it into Python.
+    It is sent from the start of the file, so a retry sends it whole.
     """
+    page_file.seek(0)
+    with server.transfercmd(f'STOR {new_name}') as conn:
+        conn.sendfile(page_file)
+    server.voidresp()
+
+
+def _put_pages_ftp(pending, host, user, password, path,
+                   tries, delay, backoff, skip_existing):
+    """Upload queued (page, name) pairs over a new FTP connection
+
+    Each STOR is retried as described in send_pages_ftp. Failure to
+    upload a page, whether the server refuses it or the local file
+    can't be read, is logged and the remaining pages are still
+    attempted. Any other error, such as a timeout or dropped connection
+    that leaves the server's replies out of step, is logged and ends
+    this connection's uploads.
+
+    Returns False if the connection couldn't be made or logged in,
+    leaving the queued pages to other workers, otherwise True.
+    """
+    try:
+        connection = ftplib.FTP(host=host, user=user, passwd=password)
+    except ftplib.all_errors as e:
+        logger.warning('Could not connect to %s as %s: %s', host, user, e)
+        return False
     try:
-        with ftplib.FTP(host=host, user=user, passwd=password) as server:
+        with connection as server:
             logger.debug('Connected to %s as %s', host, user)
             if path is not None:
                 server.cwd(path)
                 logger.debug('Changed to directory %s', path)
-            for page in pages:
-                if rename:
-                    new_name = page.external_name()
-                else:
-                    new_name = page.path.name
-                with open(page.path, 'rb') as page_file:
-                    logger.debug('Opened %s for uploading', page.path)
-                    server.storbinary(
-                        f'STOR {new_name}',
-                        page_file)
-                    logger.info('Uploaded file: %24s  ->  %-24s',
+            server.voidcmd('TYPE I')
+            for page, new_name in _take_all(pending):
+                if (skip_existing and
+                        _ftp_is_current(server, page, new_name)):
+                    logger.info('Already uploaded: %24s  ->  %-24s',
                                 page, new_name)
+                    continue
+                try:
+                    opened = open(page.path, 'rb')
+                except OSError as e:
+                    logger.error('Could not upload %s: %s', page, e)
+                    continue
+                with opened as page_file:
+                    logger.debug('Opened %s for uploading', page.path)
+                    try:
+                        _retry(lambda: _stor_page(server, page_file,
+                                                  new_name),
+                               tries, delay, backoff, ftplib.error_temp)
+                    except (ftplib.error_temp, ftplib.error_perm) as e:
+                        logger.error('Could not upload %s: %s', page, e)
+                        continue
+                logger.info('Uploaded file: %24s  ->  %-24s',
+                            page, new_name)
     except ftplib.all_errors as e:
         logger.error('FTP uploading encountered an error: %s', e)
+    return True
 
 
-def send_pages_sftp(pages, host, user, password=None,
-                    port=22, path=None, rename=True):
-    """Upload a set of Pages to an SFTP server
+def send_pages_ftp(pages, host, user, password='',
+                   path=None, rename=True, tries=3, delay=1, backoff=2,
+                   skip_existing=False, max_workers=4):
+    """Upload a set of Pages to an FTP server
 
     pages: [Page],
     host: str,
     user: str,
-    password: str = None,
-    port: int = 22,
+    passwd: str = '',
     path: str = None,
-    rename: bool = True
+    rename: bool = True,
+    tries: int = 3,
+    delay: float = 1,
+    backoff: float = 2,
+    skip_existing: bool = False,
+    max_workers: int = 4
 
-    Mostly a convenience wrapper around paramiko's classes.
-
-    If password is None, private keys will be loaded from
-    the system for authentication.
+    Mostly a convenience wrapper around ftplib.FTP.
 
     If given, path refers to the subdirectory or chain of
     subdirectories into which the FTP client will change
@@ -73,7 +220,54 @@ def send_pages_sftp(pages, host, user, password=None,
 
     If rename is True (the default), each page will be renamed
     by calling its external_name method. If rename is False the
-    page's current filename will be used.
+    page's current filename will be used. Pages are uploaded in order
+    of those names, and if several pages share a name only the last
+    of them is uploaded.
+
+    Pages are taken from a shared queue by up to max_workers threads,
+    each with its own connection to the server, as an FTP connection
+    transfers one file at a time. A connection that the server refuses
+    (servers often limit connections per user) leaves its pages to the
+    others, and an error is logged only if no connection logged in;
+    with max_workers=1 every page is sent in name order over a single
+    connection.
+
+    Each page is tried up to tries times if the server reports a
+    temporary error, waiting delay seconds before the first retry and
+    backoff times longer before each one after. If a page still fails,
+    is refused by the server or can't be read, it is logged and
+    skipped. A timeout or other connection error is logged and ends
+    that connection's uploads, leaving the pages it hasn't taken to any
+    other connections. Raises ValueError if tries is less than 1.
+
+    If skip_existing is True, pages already on the server with the
+    same size and a modification time no earlier than the local file
+    (checked with SIZE and MDTM) are not uploaded again.
+    """
+    _check_tries(tries)
+    uploads = _remote_names(pages, rename)
+    pending = _upload_queue(uploads)
+    workers = max(1, min(max_workers, len(uploads)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = [
+            executor.submit(_put_pages_ftp, pending,
+                            host, user, password, path,
+                            tries, delay, backoff, skip_existing)
+            for _ in range(workers)]
+    if not any([result.result() for result in results]):
+        logger.error('Could not upload to %s, as no FTP connection '
+                     'could be made', host)
+
+
+def _connect_ssh(host, user, password, port, compress, keepalive):
+    """Return an SSHClient connected to host, or None if that fails
+
+    If password is None, private keys will be loaded from
+    the system for authentication. Connection errors are logged.
+
+    If compress is True, zlib compression is requested for the
+    connection. If keepalive is non-zero, a keepalive packet is sent
+    after that many seconds without traffic.
     """
     ssh_client = paramiko.SSHClient()
     ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy)
@@ -82,38 +276,214 @@ def send_pages_sftp(pages, host, user, password=None,
         logger.debug('Loaded system SSH keys')
     try:
         ssh_client.connect(hostname=host, port=port, username=user,
-                           password=password)
+                           password=password, compress=compress)
     except paramiko.AuthenticationException as e:
         logger.error('Could not connect to %s as %s'
                      'because of an authentication error',
                      host, user)
         logger.error('Error: %s', e)
-        return
+        return None
     except paramiko.BadHostKeyException as e:
         logger.error('Could not connect to %s as %s'
                      'because of an SSH key error',
                      host, user)
         logger.error('Error: %s', e)
-        return
+        return None
     except paramiko.SSHException as e:
         logger.error('Could not connect to %s as %s'
                      'because of an SSH problem',
                      host, user)
         logger.error('Error: %s', e)
-        return
+        return None
     else:
         logger.debug('Connected to %s as %s', host, user)
+        ssh_client.get_transport().set_keepalive(keepalive)
+        return ssh_client
+
+
+def _put_pages_sftp(ssh_client, pending, path, tries, delay, backoff,
+                    skip_existing):
+    """Upload queued (page, name) pairs over a new SFTP channel
+
+    Each put is retried as described in send_pages_sftp. Failure to
+    upload a page is logged and the remaining pages are still attempted.
 
-    with ssh_client.open_sftp() as server:
+    Returns False if the channel couldn't be opened or changed to path,
+    leaving the queued pages to other workers, otherwise True.
+    """
+    try:
+        channel = ssh_client.open_sftp()
+    except (OSError, paramiko.SSHException) as e:
+        logger.warning('Could not open an SFTP channel: %s', e)
+        return False
+    with channel as server:
         if path is not None:
-            server.chdir(path)
+            try:
+                server.chdir(path)
+            except (OSError, paramiko.SSHException) as e:
+                logger.warning('Could not change to directory %s: %s',
+                               path, e)
+                return False
             logger.debug('Changed to directory %s', path)
-        for page in pages:
-            if rename:
-                new_name = page.external_name()
+        for page, new_name in _take_all(pending):
+            if skip_existing and _sftp_is_current(server, page, new_name):
+                logger.info('Already uploaded: %24s  ->  %-24s',
+                            page, new_name)
+                continue
+            try:
+                _retry(lambda: server.put(page.path, new_name),
+                       tries, delay, backoff,
+                       (socket.timeout, paramiko.SSHException))
+            except (OSError, paramiko.SSHException) as e:
+                logger.error('Could not upload %s: %s', page, e)
             else:
-                new_name = page.path.name
-            server.put(page.path, new_name)
-            logger.info('Uploaded file: %24s  ->  %-24s', page, new_name)
+                logger.info('Uploaded file: %24s  ->  %-24s',
+                            page, new_name)
+    return True
+
+
+def send_pages_sftp(pages, host, user, password=None,
+                    port=22, path=None, rename=True, max_workers=8,
+                    tries=3, delay=1, backoff=2, skip_existing=False,
+                    compress=False, keepalive=30):
+    """Upload a set of Pages to an SFTP server
+
+    pages: [Page],
+    host: str,
+    user: str,
+    password: str = None,
+    port: int = 22,
+    path: str = None,
+    rename: bool = True,
+    max_workers: int = 8,
+    tries: int = 3,
+    delay: float = 1,
+    backoff: float = 2,
+    skip_existing: bool = False,
+    compress: bool = False,
+    keepalive: int = 30
+
+    Mostly a convenience wrapper around paramiko's classes.
+
+    If password is None, private keys will be loaded from
+    the system for authentication.
+
+    If compress is True, the SSH connection is compressed. This is off
+    by default as PDFs are already compressed; it may help InDesign
+    files on a slow link. Keepalive packets are sent after keepalive
+    seconds without traffic (0 to disable), so that a slow batch isn't
+    dropped by firewalls that close idle connections.
+
+    If given, path refers to the subdirectory or chain of
+    subdirectories into which the FTP client will change
+    before attempting to upload any files.
+
+    If rename is True (the default), each page will be renamed
+    by calling its external_name method. If rename is False the
+    page's current filename will be used. Pages are uploaded in order
+    of those names, and if several pages share a name only the last
+    of them is uploaded.
+
+    Pages are taken from a shared queue by up to max_workers threads,
+    each uploading over its own SFTP channel on the one SSH connection,
+    so that a batch isn't limited to one file's round trips at a time.
+    A page that fails to upload is logged and does not stop the others.
+    A worker that can't open its channel (servers often limit sessions
+    per connection) leaves its pages to the others, and an error is
+    logged only if no worker could open one.
+
+    Each page is tried up to tries times if there is an SSH error or
+    the connection times out, waiting delay seconds before the first
+    retry and backoff times longer before each one after. Raises
+    ValueError if tries is less than 1.
+
+    If skip_existing is True, pages already on the server with the
+    same size and a modification time no earlier than the local file
+    are not uploaded again.
+    """
+    _check_tries(tries)
+    ssh_client = _connect_ssh(host, user, password, port,
+                              compress, keepalive)
+    if ssh_client is None:
+        return
+
+    uploads = _remote_names(pages, rename)
+    pending = _upload_queue(uploads)
+    workers = max(1, min(max_workers, len(uploads)))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [
+                executor.submit(_put_pages_sftp, ssh_client, pending, path,
+                                tries, delay, backoff, skip_existing)
+                for _ in range(workers)]
+        if not any([result.result() for result in results]):
+            logger.error('Could not upload to %s, as no SFTP channel '
+                         'could be opened', host)
+    finally:
+        ssh_client.close()
+
+
+def send_pages_sftp_bundled(pages, host, user, password=None,
+                            port=22, path=None, rename=True,
+                            compress=False, keepalive=30):
+    """Upload a set of Pages to an SSH server as one tar stream
+
+    pages: [Page],
+    host: str,
+    user: str,
+    password: str = None,
+    port: int = 22,
+    path: str = None,
+    rename: bool = True,
+    compress: bool = False,
+    keepalive: int = 30
+
+    Instead of transferring each page over SFTP, the pages are written
+    into a tar archive that is streamed to tar running on the server,
+    which extracts them. This makes one transfer however many pages
+    there are, which is quicker for many small pages over a slow link,
+    but needs a shell and tar on the server and gives no retries or
+    per-page errors.
+
+    Authentication, compress and keepalive are as for send_pages_sftp.
 
-    ssh_client.close()
+    If given, path refers to the directory on the server, relative to
+    the login directory, into which the pages are extracted.
+
+    If rename is True (the default), each page will be renamed
+    by calling its external_name method. If rename is False the
+    page's current filename will be used. If several pages share a
+    name only the last of them is uploaded.
+    """
+    ssh_client = _connect_ssh(host, user, password, port,
+                              compress, keepalive)
+    if ssh_client is None:
+        return
+
+    command = 'tar -x -f -'
+    if path is not None:
+        command += f' -C {shlex.quote(path)}'
+    uploads = _remote_names(pages, rename)
+    try:
+        stdin, stdout, stderr = ssh_client.exec_command(command)
+        with tarfile.open(fileobj=stdin, mode='w|') as archive:
+            for page, new_name in uploads:
+                archive.add(page.path, arcname=new_name, recursive=False)
+        stdin.close()
+        # Closing stdin doesn't send EOF with older paramiko, and tar
+        # reads its input to the end before it exits
+        stdin.channel.shutdown_write()
+        status = stdout.channel.recv_exit_status()
+    except (OSError, paramiko.SSHException) as e:
+        logger.error('Could not send pages to %s: %s', host, e)
+    else:
+        if status == 0:
+            for page, new_name in uploads:
+                logger.info('Uploaded file: %24s  ->  %-24s',
+                            page, new_name)
+        else:
+            logger.error('Extracting pages on %s failed (%d): %s',
+                         host, status,
+                         stderr.read().decode(errors='replace').strip())
+    finally:
+        ssh_client.close()
@@ -0,0 +1,10 @@
+import os
+
+from hypothesis import settings
+
+# Run with HYPOTHESIS_PROFILE=fast for a quicker, shallower check
+settings.register_profile('fast', settings(max_examples=25))
+# CI runs start from a clean checkout, so saving examples is wasted work
+settings.register_profile('ci', settings(max_examples=25, database=None))
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE',
+                                'ci' if os.getenv('CI') else 'default'))
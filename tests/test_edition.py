@@ -4,12 +4,27 @@ import msutils.edition
 import unittest
 import unittest.mock as mock
 
-from hypothesis import given, assume
+from hypothesis import given
 import hypothesis.strategies as st
 
 from datetime import date
+import itertools
+import os
 import pathlib
 
+_path_exists = pathlib.Path.exists
+
+
+def _dir_entries(paths):
+    """Return mock os.DirEntry objects for paths, as from os.scandir"""
+    entries = []
+    for p in paths:
+        entry = mock.Mock(spec=os.DirEntry)
+        entry.name = p.name
+        entry.path = str(p)
+        entries.append(entry)
+    return entries
+
 
 class TestEditionDir(unittest.TestCase):
     """Test the .edition_dir function
@@ -29,29 +44,102 @@ class TestEditionDir(unittest.TestCase):
          '/Volumes/Archive since 2017']]
     archive_stores = [edition_stores[1], edition_stores[2],
                       edition_stores[4], edition_stores[5]]
+    edition_store_set = frozenset(edition_stores)
+    # Dates that could have an edition; test_raises_no_edition covers the rest
+    edition_dates = st.dates(min_date=date(2002, 1, 1),
+                             max_date=date(2029, 12, 31))
+
+    def setUp(self):
+        msutils.edition._clear_stores_cache()
+
+    # Hypothesis calls this before each example, each of which
+    # fakes a different set of connected stores
+    setup_example = setUp
+
+    def tearDown(self):
+        msutils.edition.Path.exists = _path_exists
+
+    def fake_exists(self, exists):
+        """Replace Path.exists with exists until tearDown
+
+        The function is assigned directly, rather than through
+        mock.patch, so Hypothesis examples don't each build a mock.
+        """
+        msutils.edition.Path.exists = exists
 
-    @given(dt=st.dates())
-    @mock.patch.object(msutils.edition.Path, 'exists', return_value=True)
-    def test_returns_path(self, mock_exists, dt):
+    def fake_store(self, store):
+        """Fake store and everything under it as the only existing paths"""
+        prefix = str(store)
+        self.fake_exists(lambda path: str(path).startswith(prefix))
+
+    def test_returns_path(self):
         """edition_dir returns a Path object"""
-        ed = msutils.edition_dir(dt)
+        self.fake_exists(lambda path: True)
+        ed = msutils.edition_dir(date(2010, 6, 15))
         self.assertIsInstance(ed, pathlib.Path)
 
-    @mock.patch.object(msutils.edition.Path, 'exists', return_value=False)
-    def test_fetch_stores_raises(self, mock_exists):
+    def test_fetch_stores_raises(self):
         """_fetch_stores raises when none of the edition stores exist
 
         _fetch_stores should return a list of all the edition stores that
         exist on the current machine. If none of them exist it should raise
         a NoEditionStoresError.
         """
+        self.fake_exists(lambda path: False)
         with self.assertRaises(msutils.NoEditionStoresError):
             msutils.edition._fetch_stores()
 
-    @given(bools=st.lists(elements=st.booleans(), min_size=6, max_size=6))
-    @mock.patch.object(msutils.edition.Path, 'exists', autospec=True)
-    def test_fetch_stores_matching_bools(self, mock_exists, bools):
-        """_fetch_stores returns paths for which mock_exist returns True
+    def count_exists(self):
+        """Fake every path as existing and return the list of checks
+
+        Each path passed to Path.exists is appended to the list, so
+        len() of it is the number of calls.
+        """
+        checked = []
+        self.fake_exists(lambda path: checked.append(path) or True)
+        return checked
+
+    @mock.patch.object(msutils.edition.time, 'monotonic')
+    def test_fetch_stores_cached(self, mock_monotonic):
+        """_fetch_stores reuses its result until STORES_CACHE_SECONDS pass"""
+        checked = self.count_exists()
+        mock_monotonic.return_value = 1000
+        first = msutils.edition._fetch_stores()
+        self.assertEqual(len(checked), len(self.edition_stores))
+
+        mock_monotonic.return_value += msutils.edition.STORES_CACHE_SECONDS / 2
+        self.assertEqual(msutils.edition._fetch_stores(), first)
+        self.assertEqual(len(checked), len(self.edition_stores))
+
+        mock_monotonic.return_value += msutils.edition.STORES_CACHE_SECONDS
+        msutils.edition._fetch_stores()
+        self.assertEqual(len(checked), 2 * len(self.edition_stores))
+
+    @mock.patch.object(msutils.edition.time, 'monotonic', return_value=1000)
+    def test_edition_dir_cached(self, mock_monotonic):
+        """edition_dir reuses a found directory while stores are cached"""
+        checked = self.count_exists()
+        first = msutils.edition_dir(date(2017, 2, 1))
+        calls = len(checked)
+        self.assertEqual(msutils.edition_dir(date(2017, 2, 1)), first)
+        self.assertEqual(len(checked), calls)
+
+        mock_monotonic.return_value += msutils.edition.STORES_CACHE_SECONDS
+        msutils.edition_dir(date(2017, 2, 1))
+        self.assertGreater(len(checked), calls)
+
+    def test_edition_dir_missing_not_cached(self):
+        """edition_dir checks again for an edition that was not found"""
+        store = self.edition_stores[0]
+        self.fake_exists(lambda path: path == store)
+        with self.assertRaises(msutils.NoEditionError):
+            msutils.edition_dir(date(2017, 2, 1))
+
+        self.fake_store(store)
+        self.assertTrue(msutils.edition_dir(date(2017, 2, 1)))
+
+    def test_fetch_stores_matching_bools(self):
+        """_fetch_stores returns paths for which Path.exists returns True
 
         The paths are known quantities:
             * ~/Server/Pages                        # Local Pages
@@ -61,40 +149,42 @@ class TestEditionDir(unittest.TestCase):
             * /Volumes/Archive-2002-2016            # Remote old archive
             * /Volumes/Archive-Since-2017           # Remote new archive
 
-        These are zipped with a list of booleans — those zipped with True
-        should be present in the output list.
+        These are zipped with each combination of booleans — those zipped
+        with True should be present in the output list.
         """
-        assume(any(bools))  # All False would raise an error, tested separately
-        paths_exist = dict(zip(self.edition_stores, bools))
-        mock_exists.side_effect = lambda path: paths_exist[path]
-
-        # Only test the paths, not the templates _fetch_stores returns
-        self.assertEqual(
-            sorted(p for (p, t) in msutils.edition._fetch_stores()),
-            sorted(p for p in paths_exist if paths_exist[p]))
-
-    @given(picked_path=st.sampled_from(edition_stores))
-    @mock.patch.object(msutils.edition.Path, 'exists', autospec=True)
-    def test_edition_dir_tests_all(self, mock_exists, picked_path):
+        for bools in itertools.product((False, True), repeat=6):
+            if not any(bools):
+                continue  # All False raises an error, tested separately
+            with self.subTest(bools=bools):
+                msutils.edition._clear_stores_cache()
+                paths_exist = dict(zip(self.edition_stores, bools))
+                self.fake_exists(lambda path: paths_exist[path])
+
+                # Only test the paths, not the templates _fetch_stores returns
+                self.assertEqual(
+                    sorted(p for (p, t) in msutils.edition._fetch_stores()),
+                    sorted(p for p in paths_exist if paths_exist[p]))
+
+    def test_edition_dir_tests_all(self):
         """edition_dir should return path when it is found in any store
 
         Here we mock out exists and return True for one of the six edition
         stores. We also return True for any directory that is a subdirectory
         (at any level) of the picked edition store path.
 
-        Using Hypothesis lets us check that this works for any of the
-        edition stores, and not just a single (perhaps hard-coded) one.
+        Each of the edition stores is picked in turn, to check that this
+        works for any of them, and not just a single (perhaps hard-coded) one.
         """
-        def exists_faker(path):
-            return str(path).startswith(str(picked_path))
-        mock_exists.side_effect = exists_faker
-        assert msutils.edition_dir(date(2010, 9, 20))
+        for picked_path in self.edition_stores:
+            with self.subTest(picked_path=picked_path):
+                msutils.edition._clear_stores_cache()
+                self.fake_store(picked_path)
+                assert msutils.edition_dir(date(2010, 9, 20))
 
     @given(
-        dt=st.dates(),
+        dt=edition_dates,
         picked_path=st.sampled_from([edition_stores[0], edition_stores[3]]))
-    @mock.patch.object(msutils.edition.Path, 'exists', autospec=True)
-    def test_expected_format_for_current(self, mock_exists, picked_path, dt):
+    def test_expected_format_for_current(self, picked_path, dt):
         """edition_dir uses expected path format for 'current' editions
 
         Current edition dirs are found at:
@@ -107,17 +197,14 @@ class TestEditionDir(unittest.TestCase):
 
         Hypothesis is used to generate dates
         """
-        def exists_faker(path):
-            return str(path).startswith(str(picked_path))
-        mock_exists.side_effect = exists_faker
+        self.fake_store(picked_path)
 
         ed = msutils.edition_dir(dt)
         expected_pattern = f'/Server/Pages/{dt:%Y-%m-%d %A %b %-d}'
         assert str(ed).endswith(expected_pattern)
 
-    @given(dt=st.dates(), picked_path=st.sampled_from(archive_stores))
-    @mock.patch.object(msutils.edition.Path, 'exists', autospec=True)
-    def test_expected_format_for_archive(self, mock_exists, picked_path, dt):
+    @given(dt=edition_dates, picked_path=st.sampled_from(archive_stores))
+    def test_expected_format_for_archive(self, picked_path, dt):
         """edition_dir uses expected path format for 'archive' editions
 
         Archive edition dirs are found at:
@@ -136,9 +223,7 @@ class TestEditionDir(unittest.TestCase):
 
         Hypothesis is used to generate dates
         """
-        def exists_faker(path):
-            return str(path).startswith(str(picked_path))
-        mock_exists.side_effect = exists_faker
+        self.fake_store(picked_path)
 
         ed = msutils.edition_dir(dt)
         expected_pattern = f'/{dt:%Y}/{dt:%m %B}/{dt:%Y-%m-%d %A}'
@@ -147,8 +232,7 @@ class TestEditionDir(unittest.TestCase):
     @given(dt=st.one_of(
             st.dates(max_date=date(2001, 12, 31)),
             st.dates(min_date=date(2030, 1, 1))))
-    @mock.patch.object(msutils.edition.Path, 'exists', autospec=True)
-    def test_raises_no_edition(self, mock_exists, dt):
+    def test_raises_no_edition(self, dt):
         """edition_dir raises NoEditionError when it can't find the directory
 
         Mocking ensures that the edition stores are available, so this
@@ -158,9 +242,7 @@ class TestEditionDir(unittest.TestCase):
 
         (God forbid you're still running these tests in 2030.)
         """
-        def exists_faker(path):
-            return path in self.edition_stores
-        mock_exists.side_effect = exists_faker
+        self.fake_exists(lambda path: path in self.edition_store_set)
         with self.assertRaises(msutils.NoEditionError):
             msutils.edition_dir(dt)
 
@@ -172,63 +254,54 @@ class TestEditionFiles(unittest.TestCase):
     edition_press_pdfs
     edition_web_pdfs
     """
-    def setUp(self):
-        self.no_edition = date(2000, 1, 2)
+    @classmethod
+    def setUpClass(cls):
+        cls.no_edition = date(2000, 1, 2)
         names = [f'{i}_Section_020100.' for i in range(1, 17)]
-        self.indd_names = [pathlib.Path(n + 'indd') for n in names]
-        self.pdf_names = [pathlib.Path(n + 'pdf') for n in names]
-
-    @mock.patch('msutils.edition', 'os.walk')
-    @mock.patch.object(msutils.edition.Path, 'rglob')
-    @mock.patch.object(msutils.edition.Path, 'exists', return_value=True)
-    def test_indd_files_extensions(self, mock_exists,
-                                   mock_rglob=None, mock_walk=None):
-        """Test Page types for edition_indd_files
+        cls.indd_names = tuple(pathlib.Path(n + 'indd') for n in names)
+        cls.pdf_names = tuple(pathlib.Path(n + 'pdf') for n in names)
+        cls.pdf_pages = [msutils.Page(path) for path in cls.pdf_names]
 
-        Function should use either Path.rglob or os.walk to recursively
-        find all InDesign files in the edition directory. This is done
-        because supplements are often stored in a subdirectory of the
-        edition, to avoid cluttering the edition listing.
+    def setUp(self):
+        msutils.edition._clear_stores_cache()
+        self.addCleanup(setattr, msutils.edition.Path, 'exists', _path_exists)
+
+    @mock.patch.object(msutils.edition.os, 'walk')
+    def test_indd_files_extensions(self, mock_walk):
+        """Test Page types for edition_indd_files
 
-        Both Path.rglob and os.walk are mocked out and it is acceptable
-        to use either.
+        Function should use os.walk to recursively find all InDesign
+        files in the edition directory. This is done because supplements
+        are often stored in a subdirectory of the edition, to avoid
+        cluttering the edition listing.
 
         All the Pages returned by the function should have a .type of 'indd'
         """
-        indd_gen = (x for x in self.indd_names)
-
-        # mock_rglob always needs a value because pathlib is always imported
-        mock_rglob.return_value = indd_gen
-        if mock_walk is not None:
-            # os is only imported by edition if walk is needed
-            mock_walk.side_effect = [
-                ['', [], self.indd_list[:8]],
-                ['', [], self.indd_list[8:]]]
+        msutils.edition.Path.exists = lambda path: True
+        names = [p.name for p in self.indd_names]
+        mock_walk.return_value = [
+            ('edition', ['supplement'], names[:8] + ['notes.txt']),
+            ('edition/supplement', [], names[8:])]
 
         res = msutils.edition_indd_files(self.no_edition)
         self.assertEqual({p.type for p in res}, {'indd'})
         self.assertEqual(len(res), len(self.indd_names))
+        mock_walk.assert_called_once()
 
-        if mock_walk is not None:
-            mock_walk.assert_called()
-        else:
-            mock_rglob.assert_called()
-
-    @mock.patch.object(msutils.edition.Path, 'exists', return_value=True)
-    def test_pdf_files_extensions(self, mock_exists):
+    def test_pdf_files_extensions(self):
         """Test Page types for edition_press_pdfs and edition_web_pdfs
 
         All the Pages returned by the function should have a .type of 'pdf'
         """
-        pdf_gen = (x for x in self.pdf_names)
-        with mock.patch.object(msutils.edition.Path, 'iterdir',
-                               return_value=pdf_gen):
+        msutils.edition.Path.exists = lambda path: True
+        entries = _dir_entries(self.pdf_names)
+        with mock.patch.object(msutils.edition.os, 'scandir') as mock_scandir:
+            mock_scandir.return_value.__enter__.return_value = entries
             res = msutils.edition_press_pdfs(self.no_edition)
             res.extend(msutils.edition_web_pdfs(self.no_edition))
             self.assertEqual({p.type for p in res}, {'pdf'})
 
-    @mock.patch.object(msutils.edition.Path, 'exists', return_value=False)
-    def test_directory_pdfs_missing(self, mock_exists):
+    def test_directory_pdfs_missing(self):
         """directory_pdfs returns an empty list if the directory does not exist
 
         This is acceptable rather than throwing an exception because the PDFs
@@ -237,26 +310,27 @@ class TestEditionFiles(unittest.TestCase):
         fake_path = pathlib.Path('no-directory-here')
         self.assertEqual(msutils.directory_pdfs(fake_path), [])
 
-    @mock.patch.object(msutils.edition.Path, 'iterdir')
-    @mock.patch.object(msutils.edition.Path, 'exists', return_value=True)
-    def test_directory_pdfs_filter_nonpages(self, mock_exists, mock_iterdir):
+    @mock.patch.object(msutils.edition.os, 'scandir')
+    def test_directory_pdfs_filter_nonpages(self, mock_scandir):
         """directory_pdfs returns expected number of pages from directory"""
-        mock_iterdir.return_value = [pathlib.Path('A1_TestPage_010217.pdf'),
-                                     pathlib.Path('not-a-page.pdf')]
+        entries = _dir_entries([pathlib.Path('A1_TestPage_010217.pdf'),
+                                pathlib.Path('not-a-page.pdf'),
+                                pathlib.Path('A2_TestPage_010217.indd')])
+        mock_scandir.return_value.__enter__.return_value = entries
         res = msutils.directory_pdfs(pathlib.Path('dummy-dir'))
         self.assertEqual(len(res), 1)
 
     def test_filter_pages_for_date_all_same(self):
         """No pages filtered if date is what is expected."""
-        pages = [msutils.Page(path) for path in self.pdf_names]
         self.assertEqual(
-            pages,
-            msutils.edition._filter_pages_for_date(pages, date=self.no_edition)
+            self.pdf_pages,
+            msutils.edition._filter_pages_for_date(self.pdf_pages,
+                                                   date=self.no_edition)
         )
 
     def test_filter_pages_for_date_filters_mixed_dates(self):
         """Only pages with matching date are returned"""
-        same_date_pages = [msutils.Page(path) for path in self.pdf_names]
+        same_date_pages = self.pdf_pages
         mixed_date_pages = same_date_pages + [
             msutils.Page(pathlib.Path(f'1_Front_3107{year}.pdf')) for year in range(50, 60)
         ]
@@ -264,3 +338,69 @@ class TestEditionFiles(unittest.TestCase):
             same_date_pages,
             msutils.edition._filter_pages_for_date(mixed_date_pages, date=self.no_edition)
         )
+
+    @mock.patch.object(msutils.edition, 'logger')
+    def test_filter_pages_for_date_empty(self, mock_logger):
+        """No pages are returned without warning"""
+        self.assertEqual(
+            [],
+            msutils.edition._filter_pages_for_date([], date=self.no_edition)
+        )
+        mock_logger.warning.assert_not_called()
+
+    def test_filter_pages_for_date_keeps_duplicates(self):
+        """Equal pages from different directories are all returned"""
+        pages = [msutils.Page(pathlib.Path('1_Front_020100.indd')),
+                 msutils.Page(pathlib.Path('old/1_Front_020100.indd')),
+                 msutils.Page(pathlib.Path('1_Front_030100.indd'))]
+        self.assertEqual(
+            [p.path for p in pages[:2]],
+            [p.path for p in msutils.edition._filter_pages_for_date(
+                pages, date=self.no_edition)]
+        )
+
+
+class TestEdition(unittest.TestCase):
+    """Test the Edition class
+
+    It should find the edition directory once, when created, and
+    reuse it to list the edition's InDesign files and PDFs.
+    """
+    def setUp(self):
+        self.date = date(2017, 2, 1)
+        self.dir = pathlib.Path('edition')
+
+    @mock.patch.object(msutils.edition.os, 'scandir')
+    @mock.patch.object(msutils.edition.os, 'walk', return_value=[])
+    @mock.patch.object(msutils.edition, 'edition_dir')
+    def test_edition_dir_found_once(self, mock_edition_dir,
+                                    mock_walk, mock_scandir):
+        """Edition only calls edition_dir when it is created"""
+        mock_edition_dir.return_value = self.dir
+        mock_scandir.return_value.__enter__.return_value = []
+
+        ed = msutils.Edition(self.date)
+        ed.indd_files()
+        ed.press_pdfs()
+        ed.web_pdfs()
+        mock_edition_dir.assert_called_once_with(self.date)
+
+    @mock.patch.object(msutils.edition.os, 'scandir')
+    @mock.patch.object(msutils.edition, 'edition_dir')
+    def test_pdf_subdirectories(self, mock_edition_dir, mock_scandir):
+        """PDFs are listed from the expected edition subdirectories"""
+        mock_edition_dir.return_value = self.dir
+        mock_scandir.return_value.__enter__.return_value = []
+
+        ed = msutils.Edition(self.date)
+        ed.press_pdfs()
+        mock_scandir.assert_called_with(self.dir / 'PDFs 010217')
+        ed.web_pdfs()
+        mock_scandir.assert_called_with(self.dir / 'E-edition PDFs 010217')
+
+    @mock.patch.object(msutils.edition, 'edition_dir')
+    def test_raises_no_edition(self, mock_edition_dir):
+        """Edition raises NoEditionError when edition_dir does"""
+        mock_edition_dir.side_effect = msutils.NoEditionError
+        with self.assertRaises(msutils.NoEditionError):
+            msutils.Edition(self.date)
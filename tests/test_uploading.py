@@ -3,8 +3,23 @@ import unittest
 import unittest.mock as mock
 
 import ftplib
+import io
 import paramiko
 from pathlib import Path
+import socket
+import tarfile
+import tempfile
+
+
+def _mock_pages(count):
+    """Return count mock Pages with distinct paths and external names"""
+    pages = []
+    for n in range(count):
+        m = mock.Mock()
+        m.path = Path(f'/Mock/Path{n}.file')
+        m.external_name.return_value = f'Renamed{n}'
+        pages.append(m)
+    return pages
 
 
 class TestFTP(unittest.TestCase):
@@ -17,7 +32,12 @@ class TestFTP(unittest.TestCase):
             user: str,
             password: str = '',
             path: str = None,
-            rename: bool = True
+            rename: bool = True,
+            tries: int = 3,
+            delay: float = 1,
+            backoff: float = 2,
+            skip_existing: bool = False,
+            max_workers: int = 4
             )
 
     It should iterate over the pages and upload them to the
@@ -74,9 +94,11 @@ class TestFTP(unittest.TestCase):
         mock_path = self.mock_pages[0].path
         mock_open.assert_called_once()
         mock_open.assert_called_with(mock_path, 'rb')
-        ftp_cm.storbinary.assert_called_once()
-        ftp_cm.storbinary.assert_called_with(
-                f'STOR { mock_path.name }', open_cm)
+        ftp_cm.voidcmd.assert_called_once_with('TYPE I')
+        ftp_cm.transfercmd.assert_called_once_with(f'STOR { mock_path.name }')
+        conn = ftp_cm.transfercmd.return_value.__enter__.return_value
+        conn.sendfile.assert_called_once_with(open_cm)
+        ftp_cm.voidresp.assert_called_once()
 
     @mock.patch('builtins.open', autospec=True)
     @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
@@ -91,12 +113,223 @@ class TestFTP(unittest.TestCase):
             )
 
         mock_page = self.mock_pages[0]
-        page_name = mock_page.external_name()
+        page_name = mock_page.external_name.return_value
+        mock_page.external_name.assert_called_once_with()
         mock_open.assert_called_once()
         mock_open.assert_called_with(mock_page.path, 'rb')
-        ftp_cm.storbinary.assert_called_once()
-        ftp_cm.storbinary.assert_called_with(
-                f'STOR { page_name }', open_cm)
+        ftp_cm.voidcmd.assert_called_once_with('TYPE I')
+        ftp_cm.transfercmd.assert_called_once_with(f'STOR { page_name }')
+        conn = ftp_cm.transfercmd.return_value.__enter__.return_value
+        conn.sendfile.assert_called_once_with(open_cm)
+        ftp_cm.voidresp.assert_called_once()
+
+    @mock.patch.object(msutils.uploading.time, 'sleep')
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_stor_retried(self, mock_FTP, mock_open, mock_sleep):
+        """STOR is retried with backoff, resending the file from its start"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        ftp_cm.transfercmd.side_effect = [
+            ftplib.error_temp('421'), ftplib.error_temp('421'),
+            mock.MagicMock()]
+        msutils.uploading.send_pages_ftp(
+            pages=self.mock_pages,
+            delay=2,
+            **self.call_args
+            )
+        self.assertEqual(ftp_cm.transfercmd.call_count, 3)
+        open_cm = mock_open.return_value.__enter__.return_value
+        self.assertEqual(open_cm.seek.call_args_list, [mock.call(0)] * 3)
+        self.assertEqual(mock_sleep.call_args_list,
+                         [mock.call(2), mock.call(4)])
+
+    @mock.patch.object(msutils.uploading.time, 'sleep')
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_stor_gives_up(self, mock_FTP, mock_open, mock_sleep):
+        """A page failing every try is logged and the next is uploaded"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        ftp_cm.transfercmd.side_effect = [
+            ftplib.error_temp('421'), ftplib.error_temp('421'),
+            mock.MagicMock()]
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_ftp(
+                pages=_mock_pages(2),
+                tries=2,
+                max_workers=1,
+                **self.call_args
+                )
+        self.assertEqual(ftp_cm.transfercmd.call_count, 3)
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_stor_refused(self, mock_FTP, mock_open):
+        """A page the server refuses is logged and the next is uploaded"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        ftp_cm.transfercmd.side_effect = [
+            ftplib.error_perm('553 Bad file name'), mock.MagicMock()]
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_ftp(
+                pages=_mock_pages(2),
+                max_workers=1,
+                **self.call_args
+                )
+        self.assertEqual(ftp_cm.transfercmd.call_args_list,
+                         [mock.call('STOR Renamed0'),
+                          mock.call('STOR Renamed1')])
+        ftp_cm.voidresp.assert_called_once_with()
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_timeout_ends_connection(self, mock_FTP, mock_open):
+        """A timeout isn't retried on the same connection, but logged"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        ftp_cm.transfercmd.side_effect = socket.timeout('timed out')
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_ftp(
+                pages=_mock_pages(2),
+                max_workers=1,
+                **self.call_args
+                )
+        ftp_cm.transfercmd.assert_called_once_with('STOR Renamed0')
+        ftp_cm.voidresp.assert_not_called()
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_unreadable_page_skipped(self, mock_FTP, mock_open):
+        """A page that can't be opened is logged and the next is uploaded"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        mock_open.side_effect = [
+            FileNotFoundError(2, 'No such file'), mock.DEFAULT]
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_ftp(
+                pages=_mock_pages(2),
+                max_workers=1,
+                **self.call_args
+                )
+        ftp_cm.transfercmd.assert_called_once_with('STOR Renamed1')
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_stor_sorted_unique(self, mock_FTP, mock_open):
+        """Pages are sent in order of name, once for each name"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        first, second = _mock_pages(2)
+        duplicate = mock.Mock()
+        duplicate.path = Path('/Mock/Duplicate.file')
+        duplicate.external_name.return_value = 'Renamed1'
+        with self.assertLogs(msutils.uploading.logger, 'WARNING'):
+            msutils.uploading.send_pages_ftp(
+                pages=[second, first, duplicate],
+                max_workers=1,
+                **self.call_args
+                )
+        self.assertEqual(ftp_cm.transfercmd.call_args_list,
+                         [mock.call('STOR Renamed0'),
+                          mock.call('STOR Renamed1')])
+        self.assertEqual(mock_open.call_args_list,
+                         [mock.call(first.path, 'rb'),
+                          mock.call(duplicate.path, 'rb')])
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_skip_existing(self, mock_FTP, mock_open):
+        """Pages matching the server's size and time are not resent"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        ftp_cm.size.return_value = 4
+        ftp_cm.sendcmd.return_value = '213 20170201120000'
+        current, newer = _mock_pages(2)
+        current.path = mock.Mock()
+        current.path.stat.return_value = mock.Mock(
+            st_size=4, st_mtime=1485950000.5)
+        newer.path = mock.Mock()
+        newer.path.stat.return_value = mock.Mock(
+            st_size=4, st_mtime=1485960000.5)
+        msutils.uploading.send_pages_ftp(
+            pages=[current, newer],
+            skip_existing=True,
+            **self.call_args
+            )
+        ftp_cm.transfercmd.assert_called_once_with('STOR Renamed1')
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_skip_existing_errors(self, mock_FTP, mock_open):
+        """A failed check uploads the page, or logs it if it is missing"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        ftp_cm.size.side_effect = ftplib.error_temp('450 Not available')
+        missing, present = _mock_pages(2)
+        missing.path = mock.Mock()
+        missing.path.stat.side_effect = FileNotFoundError(2, 'No such file')
+        present.path = mock.Mock()
+        present.path.stat.return_value = mock.Mock(
+            st_size=4, st_mtime=1485950000.5)
+        mock_open.side_effect = [
+            FileNotFoundError(2, 'No such file'), mock.DEFAULT]
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_ftp(
+                pages=[missing, present],
+                skip_existing=True,
+                max_workers=1,
+                **self.call_args
+                )
+        ftp_cm.transfercmd.assert_called_once_with('STOR Renamed1')
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_stor_shared_between_workers(self, mock_FTP, mock_open):
+        """FTP stores every page, over one connection per worker"""
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        pages = _mock_pages(5)
+        msutils.uploading.send_pages_ftp(
+            pages=pages,
+            path=self.path,
+            rename=False,
+            max_workers=2,
+            **self.call_args
+            )
+        self.assertEqual(mock_FTP.call_count, 2)
+        self.assertEqual(ftp_cm.cwd.call_count, 2)
+        self.assertEqual(ftp_cm.voidcmd.call_count, 2)
+        self.assertCountEqual(
+            ftp_cm.transfercmd.call_args_list,
+            [mock.call(f'STOR {p.path.name}') for p in pages])
+
+    @mock.patch('builtins.open', autospec=True)
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_login_failure_leaves_pages_to_others(self, mock_FTP,
+                                                      mock_open):
+        """FTP stores every page even if one connection is refused
+
+        The refusal is logged as a warning, as the batch still completes.
+        """
+        mock_FTP.side_effect = [
+            ftplib.error_perm('530 Too many connections'), mock.DEFAULT]
+        ftp_cm = mock_FTP.return_value.__enter__.return_value
+        pages = _mock_pages(4)
+        with self.assertLogs(msutils.uploading.logger, 'WARNING') as cm:
+            msutils.uploading.send_pages_ftp(
+                pages=pages,
+                rename=False,
+                max_workers=2,
+                **self.call_args
+                )
+        self.assertFalse([r for r in cm.records if r.levelname == 'ERROR'])
+        self.assertEqual(mock_FTP.call_count, 2)
+        self.assertCountEqual(
+            ftp_cm.transfercmd.call_args_list,
+            [mock.call(f'STOR {p.path.name}') for p in pages])
+
+    @mock.patch.object(msutils.uploading.ftplib, 'FTP', autospec=True)
+    def test_FTP_no_tries_rejected(self, mock_FTP):
+        """tries below 1 raises ValueError before connecting"""
+        with self.assertRaises(ValueError):
+            msutils.uploading.send_pages_ftp(
+                pages=self.mock_pages,
+                tries=0,
+                **self.call_args
+                )
+        mock_FTP.assert_not_called()
 
     @mock.patch.object(msutils.uploading.ftplib, 'FTP')
     def test_FTP_handles_errors(self, mock_FTP):
@@ -122,7 +355,14 @@ class TestSFTP(unittest.TestCase):
             password: str = None,
             port: int = 22,
             path: str = None,
-            rename: bool = True
+            rename: bool = True,
+            max_workers: int = 8,
+            tries: int = 3,
+            delay: float = 1,
+            backoff: float = 2,
+            skip_existing: bool = False,
+            compress: bool = False,
+            keepalive: int = 30
             )
 
     It should iterate over the pages and upload them to
@@ -141,7 +381,8 @@ class TestSFTP(unittest.TestCase):
         self.call_args = dict(host='host', user='user',
                               password='password', port=526)
         self.sftp_args = dict(hostname='host', username='user',
-                              password='password', port=526)
+                              password='password', port=526,
+                              compress=False)
 
         self.path = 'sub/dir'
 
@@ -155,6 +396,20 @@ class TestSFTP(unittest.TestCase):
         mock_ssh.assert_called_once()
         client.connect.assert_called_with(**self.sftp_args)
 
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_connection_options(self, mock_ssh):
+        """Compression and keepalive are passed to the connection"""
+        client = mock_ssh.return_value
+        msutils.uploading.send_pages_sftp(
+            pages=self.mock_pages,
+            compress=True,
+            keepalive=10,
+            **self.call_args)
+        client.connect.assert_called_with(
+            **dict(self.sftp_args, compress=True))
+        client.get_transport.return_value.set_keepalive.assert_called_with(
+            10)
+
     @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
     def test_SFTP_loads_keys_with_no_password(self, mock_ssh):
         """Test loading of SSH keys when no password is supplied"""
@@ -204,9 +459,149 @@ class TestSFTP(unittest.TestCase):
             path=self.path,
             rename=True,
             **self.call_args)
+        mock_page = self.mock_pages[0]
+        mock_page.external_name.assert_called_once_with()
         sftp.put.assert_called_with(
-            self.mock_pages[0].path,
-            self.mock_pages[0].external_name())
+            mock_page.path,
+            mock_page.external_name.return_value)
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_put_shared_between_workers(self, mock_ssh):
+        """SFTP puts every page, over one channel per worker"""
+        sftp = mock.Mock(spec=msutils.uploading.paramiko.SFTPClient)
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.return_value.__enter__.return_value = sftp
+        pages = _mock_pages(5)
+        msutils.uploading.send_pages_sftp(
+            pages=pages,
+            path=self.path,
+            rename=False,
+            max_workers=2,
+            **self.call_args)
+        self.assertEqual(ssh_client.open_sftp.call_count, 2)
+        self.assertEqual(sftp.chdir.call_count, 2)
+        self.assertCountEqual(
+            sftp.put.call_args_list,
+            [mock.call(p.path, p.path.name) for p in pages])
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_no_tries_rejected(self, mock_ssh):
+        """tries below 1 raises ValueError before connecting"""
+        with self.assertRaises(ValueError):
+            msutils.uploading.send_pages_sftp(
+                pages=self.mock_pages,
+                tries=0,
+                **self.call_args)
+        mock_ssh.assert_not_called()
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_channel_failure_leaves_pages_to_others(self, mock_ssh):
+        """A worker that can't open a channel leaves its pages to others
+
+        The failure is logged as a warning, not raised, and the
+        connection is still closed.
+        """
+        sftp = mock.Mock(spec=msutils.uploading.paramiko.SFTPClient)
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.side_effect = [
+            paramiko.SSHException('No channel'), mock.DEFAULT]
+        ssh_client.open_sftp.return_value.__enter__.return_value = sftp
+        pages = _mock_pages(4)
+        with self.assertLogs(msutils.uploading.logger, 'WARNING') as cm:
+            msutils.uploading.send_pages_sftp(
+                pages=pages,
+                rename=False,
+                max_workers=2,
+                **self.call_args)
+        self.assertFalse([r for r in cm.records if r.levelname == 'ERROR'])
+        self.assertCountEqual(
+            sftp.put.call_args_list,
+            [mock.call(p.path, p.path.name) for p in pages])
+        ssh_client.close.assert_called_once()
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_no_channel_logged(self, mock_ssh):
+        """An error is logged if no worker could open a channel"""
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.side_effect = paramiko.SSHException(
+            'No channel')
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_sftp(
+                pages=_mock_pages(2),
+                max_workers=2,
+                **self.call_args)
+        ssh_client.close.assert_called_once()
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_put_errors_logged(self, mock_ssh):
+        """SFTP logs a failed put and carries on with the other pages"""
+        sftp = mock.Mock(spec=msutils.uploading.paramiko.SFTPClient)
+        sftp.put.side_effect = [OSError('Failure'), None]
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.return_value.__enter__.return_value = sftp
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_sftp(
+                pages=_mock_pages(2),
+                max_workers=1,
+                **self.call_args)
+        self.assertEqual(sftp.put.call_count, 2)
+
+    @mock.patch.object(msutils.uploading.time, 'sleep')
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_put_retried(self, mock_ssh, mock_sleep):
+        """SFTP put is retried after an SSH error"""
+        sftp = mock.Mock(spec=msutils.uploading.paramiko.SFTPClient)
+        sftp.put.side_effect = [paramiko.SSHException('Timeout'), None]
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.return_value.__enter__.return_value = sftp
+        msutils.uploading.send_pages_sftp(
+            pages=self.mock_pages,
+            **self.call_args)
+        self.assertEqual(sftp.put.call_count, 2)
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_skip_existing(self, mock_ssh):
+        """Pages matching the server's size and time are not resent"""
+        sftp = mock.Mock(spec=msutils.uploading.paramiko.SFTPClient)
+        sftp.stat.side_effect = [
+            mock.Mock(st_size=4, st_mtime=2000),
+            FileNotFoundError(2, 'No such file')]
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.return_value.__enter__.return_value = sftp
+        pages = _mock_pages(2)
+        for page in pages:
+            page.path = mock.Mock()
+            page.path.stat.return_value = mock.Mock(
+                st_size=4, st_mtime=1000.5)
+        msutils.uploading.send_pages_sftp(
+            pages=pages,
+            max_workers=1,
+            skip_existing=True,
+            **self.call_args)
+        sftp.put.assert_called_once_with(pages[1].path, 'Renamed1')
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_skip_existing_missing_page(self, mock_ssh):
+        """A missing local page is logged by its put, not raised"""
+        sftp = mock.Mock(spec=msutils.uploading.paramiko.SFTPClient)
+        sftp.put.side_effect = [FileNotFoundError(2, 'No such file'), None]
+        ssh_client = mock_ssh.return_value
+        ssh_client.open_sftp.return_value.__enter__.return_value = sftp
+        missing, present = _mock_pages(2)
+        missing.path = mock.Mock()
+        missing.path.stat.side_effect = FileNotFoundError(2, 'No such file')
+        present.path = mock.Mock()
+        present.path.stat.return_value = mock.Mock(
+            st_size=4, st_mtime=1000.5)
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_sftp(
+                pages=[missing, present],
+                max_workers=1,
+                skip_existing=True,
+                **self.call_args)
+        self.assertEqual(sftp.put.call_count, 2)
+        sftp.stat.assert_called_once_with('Renamed1')
 
     @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
     def test_SFTP_handle_connection_exceptions(self, mock_ssh):
@@ -228,3 +623,61 @@ class TestSFTP(unittest.TestCase):
                     except Exception as e:
                         self.fail(str(e))
                 self.assertGreaterEqual(len(cm.output), 1)
+
+
+class TestSFTPBundled(unittest.TestCase):
+    """Test the tar-streaming upload function send_pages_sftp_bundled
+
+    It should connect as send_pages_sftp does, then write the pages
+    into a tar archive streamed to tar on the server, extracting to
+    the specified subdirectory (path).
+    """
+    def setUp(self):
+        self.call_args = dict(host='host', user='user',
+                              password='password', port=526)
+
+        self.stdin = mock.Mock()
+        self.sent = bytearray()
+        self.stdin.write.side_effect = self.sent.extend
+        self.stdout = mock.Mock()
+        self.stdout.channel.recv_exit_status.return_value = 0
+        self.stderr = mock.Mock()
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_bundled_tar(self, mock_ssh):
+        """Pages are streamed to tar on the server, renamed"""
+        client = mock_ssh.return_value
+        client.exec_command.return_value = (
+            self.stdin, self.stdout, self.stderr)
+        with tempfile.TemporaryDirectory() as tmp:
+            pages = _mock_pages(2)
+            for n, page in enumerate(pages):
+                page.path = Path(tmp, f'{n}.pdf')
+                page.path.write_bytes(b'page %d' % n)
+            msutils.uploading.send_pages_sftp_bundled(
+                pages=pages,
+                path='sub dir',
+                **self.call_args)
+
+        client.exec_command.assert_called_once_with(
+            "tar -x -f - -C 'sub dir'")
+        self.stdin.channel.shutdown_write.assert_called_once_with()
+        with tarfile.open(fileobj=io.BytesIO(self.sent)) as archive:
+            self.assertEqual(archive.getnames(), ['Renamed0', 'Renamed1'])
+            self.assertEqual(archive.extractfile('Renamed1').read(),
+                             b'page 1')
+        client.close.assert_called_once()
+
+    @mock.patch.object(msutils.uploading.paramiko, 'SSHClient', autospec=True)
+    def test_SFTP_bundled_tar_fails(self, mock_ssh):
+        """A failing tar on the server is logged"""
+        client = mock_ssh.return_value
+        client.exec_command.return_value = (
+            self.stdin, self.stdout, self.stderr)
+        self.stdout.channel.recv_exit_status.return_value = 2
+        self.stderr.read.return_value = b'tar: sub: Cannot open'
+        with self.assertLogs(msutils.uploading.logger, 'ERROR'):
+            msutils.uploading.send_pages_sftp_bundled(
+                pages=[],
+                path='sub',
+                **self.call_args)